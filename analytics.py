@@ -4,14 +4,21 @@
 
 # standard library
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+import hashlib
+import os
+import re
+import tempfile
 
 # third party library
 import numpy as np
 import pandas as pd
 from pandas.api.types import CategoricalDtype
 import matplotlib.pyplot as plt
-from scipy.stats import gaussian_kde
+from scipy.signal import fftconvolve
+from mpl_toolkits.axes_grid1 import make_axes_locatable
 from mpl_toolkits.basemap import Basemap
 import seaborn as sns
 from PIL import Image
@@ -26,8 +33,23 @@ from PIL import Image
 # CSV of motor vehicle collisions
 MOTOR_VEHICLE_COLLISIONS_CSV = 'Motor_Vehicle_Collisions_-_Crashes.csv'
 
-# preprocessed cleaned vehicle colision file
-CLEAN_MOTOR_VEHICLE_COLLISIONS_CSV = 'Clean_Motor_Vehicle_Collisions_-_Crashes.csv'
+# preprocessed cleaned vehicle colision file, parquet so only the needed columns are read
+CLEAN_MOTOR_VEHICLE_COLLISIONS_PARQUET = 'Clean_Motor_Vehicle_Collisions_-_Crashes.parquet'
+
+# saved cleaned analytics data, parquet keeps the column dtypes between runs
+CLEANED_ANALYTICS_PARQUET = 'cleaned_analytics_data.parquet'
+
+# directory of cached kernel density grids
+KDE_CACHE_DIR = 'cache'
+
+# directory of figures saved by visualization worker processes
+FIGURE_DIR = 'figures'
+
+# save figures to FIGURE_DIR instead of showing them, only set in visualization worker processes
+SAVE_FIGURES = False
+
+# cleaned analytics data and its years, loaded once by each visualization worker process
+WORKER_DATA = {}
 
 # ============================================================== #
 #  SECTION: Class Definitions                                   #
@@ -99,21 +121,49 @@ DAYS = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Satur
 # range of hours, military time
 HOURS = range(0, 24)
 
+# one hot coded year columns of the externally cleaned data, in the same order as YEARS
+YEAR_COLUMNS = ['CRASH YEAR {}'.format(year) for year in YEARS]
+
+# generalized contributing factor columns of the externally cleaned data
+FACTOR_COLUMNS = ['Drug Related Factor', 'Personal Factor', 'Environmental Cause Factor', 'Failure To Obey Traffic Factor']
+
+# lookup of day name to its day of the week number, 0 is Sunday
+DAY_NUMBERS = {day: number for number, day in enumerate(DAYS)}
+
+# mapping of filter name to the precomputed column it compares against
+FILTER_COLUMNS = {
+    'borough': 'BOROUGH',
+    'year': 'YEAR',
+    'month': 'MONTH',
+    'day': 'DAY',
+    'hour': 'HOUR'
+}
+
+# values of each precomputed column, the position of a value is its index into count arrays
+COLUMN_LEVELS = {
+    'BOROUGH': list(BOROUGH_COORDS),
+    'YEAR': list(YEARS),
+    'MONTH': list(MONTHS),
+    'DAY': list(DAY_NUMBERS.values()),
+    'HOUR': list(HOURS)
+}
+
+
+def filter_key(column, value):
+    """
+    Translate a filter value into the value stored in the precomputed column.
+    """
+    # days are stored as numbers, translate the day name before comparing
+    if column == 'day':
+        return DAY_NUMBERS[value]
+    return value
+
 
 def df_filter_by(df, column, value):
     """
     Returns a dataframe with rows selected from df that have value within column.
     """
-    if column == 'borough':
-        return df[df['BOROUGH'] == value]
-    elif column == 'year':
-        return df[df['CRASH TIME'].dt.year == value]
-    elif column == 'month':
-        return df[df['CRASH TIME'].dt.month == value]
-    elif column == 'day':
-        return df[df['CRASH TIME'].dt.day_name() == value]
-    elif column == 'hour':
-        return df[df['CRASH TIME'].dt.hour == value]
+    return df[df[FILTER_COLUMNS[column]] == filter_key(column, value)]
 
 
 def df_between_coords(df, coord1, coord2):
@@ -124,16 +174,45 @@ def df_between_coords(df, coord1, coord2):
     min_lat, min_long = coord1
     # min, max latitude and longitude of coord2
     max_lat, max_long = coord2
-    within_lat = (min_lat < df['LATITUDE']) & (df['LATITUDE'] < max_lat)
-    within_long = (min_long < df['LONGITUDE']) & (df['LONGITUDE'] < max_long)
-    return df[within_lat & within_long]
+    lat = df['LATITUDE'].to_numpy()
+    lon = df['LONGITUDE'].to_numpy()
+    # build a single mask and narrow it in place instead of allocating one per comparison
+    within = min_lat < lat
+    within &= lat < max_lat
+    within &= min_long < lon
+    within &= lon < max_long
+    return df[within]
 
 
 def df_between_years(df, y1, y2):
     """
     Filter dataframe by being between two year, y1 and y2.
     """
-    return df[(y1 <= df['CRASH TIME'].dt.year) & (df['CRASH TIME'].dt.year <= y2)]
+    return df[df['YEAR'].between(y1, y2)]
+
+
+def column_codes(df, column):
+    """
+    Returns the position of each row's value within the levels of a precomputed column.
+    """
+    if column == 'BOROUGH':
+        # categories are in level order already, missing boroughs are -1
+        return df['BOROUGH'].cat.codes.to_numpy()
+    # the other levels are consecutive integers
+    return df[column].to_numpy() - COLUMN_LEVELS[column][0]
+
+
+def count_combinations(df, columns):
+    """
+    Count rows for every combination of levels of the columns into an array with one dimension per column.
+    Rows with a value outside of the levels are not counted.
+    """
+    shape = tuple(len(COLUMN_LEVELS[column]) for column in columns)
+    codes = [column_codes(df, column) for column in columns]
+    within = np.logical_and.reduce([(code >= 0) & (code < size) for code, size in zip(codes, shape)])
+    # flatten each combination into a single bin so one bincount covers every dimension
+    flat_codes = np.ravel_multi_index([code[within] for code in codes], shape)
+    return np.bincount(flat_codes, minlength=int(np.prod(shape))).reshape(shape)
 
 
 def load_from_saved():
@@ -142,55 +221,90 @@ def load_from_saved():
     """
     year_df_dict = {}
     for year in YEARS:
-        year_df = pd.read_csv(f'year_{year}.csv')
-        year_df['CRASH TIME'] = pd.to_datetime(year_df['CRASH TIME'])
-        year_df_dict[year] = year_df
-    cleaned_df = pd.read_csv('cleaned_analytics_data.csv')
-    cleaned_df['CRASH TIME'] = pd.to_datetime(cleaned_df['CRASH TIME'])
+        year_df_dict[year] = pd.read_parquet(f'year_{year}.parquet')
+    cleaned_df = pd.read_parquet(CLEANED_ANALYTICS_PARQUET)
     return cleaned_df, year_df_dict
 
 
+@lru_cache(maxsize=1)
+def read_factor_data():
+    """
+    Read the externally cleaned data with one hot coded years, contributing factors and involved parties.
+    Only the columns used by the visualizations and the rows within YEARS are loaded, and only once per run.
+    The returned frame is shared between callers so it should not be modified.
+    """
+    # keep rows with any of the year columns set, row groups without any are skipped while reading
+    year_filters = [[(column, '==', 1)] for column in YEAR_COLUMNS]
+    factor_df = pd.read_parquet(CLEAN_MOTOR_VEHICLE_COLLISIONS_PARQUET, columns=YEAR_COLUMNS + FACTOR_COLUMNS + ['INVOLVED TYPE PEDESTRIAN'],
+                                filters=year_filters)
+    # the one hot coded columns only hold 0 or 1, int8 keeps them small for older int64 files
+    factor_df = factor_df.astype(np.int8)
+    # reverse the one hot coded years into a single year column, 0 for years outside of YEARS
+    year_masks = factor_df[YEAR_COLUMNS].to_numpy(dtype=bool)
+    factor_df['YEAR'] = np.select(list(year_masks.T), list(YEARS)).astype(np.int16)
+    return factor_df
+
+
 def read_data(set_location=False, save_cleaned=False, save_years=False):
     """
     Read and clean the data for most use cases.
     Additional cleaning needed for type of collision and quantizing values.
     """
-    collision_df = pd.read_csv(MOTOR_VEHICLE_COLLISIONS_CSV)
     # columns to keep
     columns = ['CRASH DATE', 'CRASH TIME', 'BOROUGH', 'LATITUDE', 'LONGITUDE', 'NUMBER OF PERSONS INJURED', 'NUMBER OF PERSONS KILLED', 'NUMBER OF PEDESTRIANS INJURED',
             'NUMBER OF PEDESTRIANS KILLED', 'NUMBER OF CYCLIST INJURED', 'NUMBER OF CYCLIST KILLED', 'NUMBER OF MOTORIST INJURED', 'NUMBER OF MOTORIST KILLED']
-    collision_df = collision_df[columns].copy()
+    # only parse the kept columns, boroughs are stored as categorical codes in the same order as BOROUGH_COORDS
+    collision_df = pd.read_csv(MOTOR_VEHICLE_COLLISIONS_CSV, usecols=columns,
+                               dtype={'CRASH DATE': str, 'CRASH TIME': str, 'BOROUGH': CategoricalDtype(categories=list(BOROUGH_COORDS))})
 
     # Combine crash date and crash time into datetime
     collision_df['CRASH TIME'] = pd.to_datetime(collision_df['CRASH DATE'] + ' ' + collision_df['CRASH TIME'], format='%m/%d/%Y %H:%M')
     del collision_df['CRASH DATE']
 
+    # precompute date parts once so filters compare small integers instead of datetimes
+    crash_time = collision_df['CRASH TIME'].dt
+    collision_df['YEAR'] = crash_time.year.astype('int16')
+    collision_df['MONTH'] = crash_time.month.astype('int8')
+    # day of the week as an index into DAYS, dayofweek starts the week on Monday
+    collision_df['DAY'] = ((crash_time.dayofweek + 1) % 7).astype('int8')
+    collision_df['HOUR'] = crash_time.hour.astype('int8')
+
     # fill NaN lat and long with 0 to treat 0 and NaN the same
     collision_df.fillna({'LATITUDE': 0, 'LONGITUDE': 0}, inplace=True)
-    cleaned_df = collision_df.copy()
 
-    # filter out where borough is blank or coordinates are 0
-    cleaned_df = cleaned_df[cleaned_df['BOROUGH'].notnull() | cleaned_df['LONGITUDE'] != 0]
+    # filter out where borough is blank and coordinates are 0, masks are built on arrays to skip index alignment
+    has_borough = collision_df['BOROUGH'].notnull().to_numpy()
+    cleaned_df = collision_df[has_borough | (collision_df['LONGITUDE'].to_numpy() != 0)]
 
     # clean an edge case on Queensboro Bridge having wrong longitude and no borough
-    cleaned_df.loc[cleaned_df['LONGITUDE'] == -201.23706, ['BOROUGH', 'LONGITUDE']] = ['MANHATTAN', -73.95337]
+    cleaned_df.loc[cleaned_df['LONGITUDE'].to_numpy() == -201.23706, ['BOROUGH', 'LONGITUDE']] = ['MANHATTAN', -73.95337]
 
     # filter out coordinates that are not in NYC
-    within_lat = (MIN_LATITUDE < cleaned_df['LATITUDE']) & (cleaned_df['LATITUDE'] < MAX_LATITUDE)
-    within_long = (MIN_LONGITUDE < cleaned_df['LONGITUDE']) & (cleaned_df['LONGITUDE'] < MAX_LONGITUDE)
+    lat = cleaned_df['LATITUDE'].to_numpy()
+    lon = cleaned_df['LONGITUDE'].to_numpy()
+    within_lat = (MIN_LATITUDE < lat) & (lat < MAX_LATITUDE)
+    within_long = (MIN_LONGITUDE < lon) & (lon < MAX_LONGITUDE)
     # these records should have borough labels and should not be thrown out as we handled that before
-    no_lat_long = ((cleaned_df['LATITUDE'] == 0) & (cleaned_df['LATITUDE'] == 0))
+    no_lat_long = (lat == 0) & (lon == 0)
     cleaned_df = cleaned_df[(within_lat & within_long) | no_lat_long]
 
+    # coordinates in NYC fit float32 and per crash counts fit int16, halving the bytes scanned by later filters
+    cleaned_df = cleaned_df.astype({'LATITUDE': 'float32', 'LONGITUDE': 'float32'})
+    count_columns = [column for column in columns if column.startswith('NUMBER OF')]
+    cleaned_df[count_columns] = cleaned_df[count_columns].fillna(0).astype('int16')
+
+    # split into years with a single groupby instead of filtering once per year
+    year_groups = dict(tuple(cleaned_df.groupby('YEAR', sort=False)))
+
     # save and output
     year_df_dict = {}
     for year in YEARS:
-        year_df = df_filter_by(cleaned_df, 'year', year)
+        year_df = year_groups.get(year, cleaned_df.iloc[:0])
         if save_years:
-            year_df.to_csv(f'year_{year}.csv')
+            year_df.to_parquet(f'year_{year}.parquet', compression='zstd')
         year_df_dict[year] = year_df
     if save_cleaned:
-        cleaned_df.to_csv('cleaned_analytics_data.csv')
+        cleaned_df.to_parquet(CLEANED_ANALYTICS_PARQUET, compression='zstd')
     return cleaned_df, year_df_dict
 
 
@@ -198,27 +312,26 @@ def query_accidents_by_value_and_year(cleaned_df, column_name, column_dict, prin
     """
     Parses dataframe and returns a dictionary indicating accidents in each month by year.
     """
-    # creates a dictionary where each key maps to a list
-    counts = defaultdict(list)
-    for year in YEARS:
-        if print_step:
-            print('Showing year:', year)
-        # remove rows from df that don't contain year in year column
-        year_df = df_filter_by(cleaned_df, 'year', year)
+    column = FILTER_COLUMNS[column_name]
+    # count accidents for every value and year in a single pass
+    value_year_counts = count_combinations(cleaned_df, [column, 'YEAR'])
 
-        # handle possibility of column dict being a dict
-        column_dict_keys = column_dict
-        if isinstance(column_dict_keys, dict):
-            column_dict_keys = column_dict_keys.keys()
+    # handle possibility of column dict being a dict
+    column_dict_keys = column_dict
+    if isinstance(column_dict_keys, dict):
+        column_dict_keys = column_dict_keys.keys()
 
-        for column_value in column_dict_keys:
-            # remove rows from df that don't contain column_value in column_name column
-            column_value_df = df_filter_by(year_df, column_name, column_value)
-            if print_step:
-                print('   ', column_dict[column_value] if(isinstance(column_dict, dict)) else column_value, column_value_df.shape[0])
-            # append number of remaining rows in month_df,
-            # each index of counts[value] correlates with year
-            counts[column_dict[column_value] if(isinstance(column_dict, dict)) else column_value].append(column_value_df.shape[0])
+    # each value maps to its row of counts, each index of the row correlates with year
+    counts = {}
+    for column_value in column_dict_keys:
+        value_index = COLUMN_LEVELS[column].index(filter_key(column_name, column_value))
+        counts[column_dict[column_value] if(isinstance(column_dict, dict)) else column_value] = value_year_counts[value_index]
+
+    if print_step:
+        for year_index, year in enumerate(YEARS):
+            print('Showing year:', year)
+            for value, value_counts in counts.items():
+                print('   ', value, value_counts[year_index])
 
     # return dictionary of mapping of values to a list of accident counts by year
     return counts
@@ -229,66 +342,56 @@ def query_accidents_by_weekday_and_time_and_year(cleaned_df, print_step=False):
     Parses dataframe and returns a dictionary indicating accidents each hour
     for each day of the week in each year.
     """
-    counts = defaultdict(lambda: defaultdict(list))
-    for year in YEARS:
+    # quantize times by top of the hour and count every year, day and hour in one pass
+    year_day_hour_counts = count_combinations(cleaned_df, ['YEAR', 'DAY', 'HOUR'])
+    counts = {}
+    for year_index, year in enumerate(YEARS):
         if print_step:
             print('Showing year:', year)
-        year_df = df_filter_by(cleaned_df, 'year', year)
-        for hour in HOURS:
-            if print_step:
+        counts[year] = {day: year_day_hour_counts[year_index, DAY_NUMBERS[day]] for day in DAYS}
+        if print_step:
+            for hour in HOURS:
                 print('   ', hour)
-            # quantize times by top of the hour
-            hour_df = df_filter_by(year_df, 'hour', hour)
-            for day in DAYS:
-                day_df = df_filter_by(hour_df, 'day', day)
-                if print_step:
-                    print('       ', day, day_df.shape[0])
-                counts[year][day].append(day_df.shape[0])
+                for day in DAYS:
+                    print('       ', day, counts[year][day][hour])
     return counts
 
 
-def query_accidents_by_borough_and_month_and_year(cleaned_df, print_step=False):
+def query_accidents_by_borough_and_year(cleaned_df, column, print_step=False):
     """
     Parses dataframe and returns a dictionary indicating accidents by borough
-    for each month in each year.
+    for each level of the precomputed column in each year.
     """
-    counts = defaultdict(lambda: defaultdict(list))
-    for year in YEARS:
+    year_borough_counts = count_combinations(cleaned_df, ['YEAR', 'BOROUGH', column])
+    # readable names of the column levels for printing
+    labels = {'MONTH': list(MONTHS.values()), 'DAY': DAYS}.get(column, COLUMN_LEVELS[column])
+    counts = {}
+    for year_index, year in enumerate(YEARS):
         if print_step:
             print('Showing year:', year)
-        year_df = df_filter_by(cleaned_df, 'year', year)
-        for borough in BOROUGH_COORDS.keys():
-            if print_step:
+        counts[year] = dict(zip(COLUMN_LEVELS['BOROUGH'], year_borough_counts[year_index]))
+        if print_step:
+            for borough, borough_counts in counts[year].items():
                 print('   ', borough)
-            borough_df = df_filter_by(year_df, 'borough', borough)
-            for month in MONTHS.keys():
-                month_df = df_filter_by(borough_df, 'month', month)
-                if print_step:
-                    print('       ', MONTHS[month], month_df.shape[0])
-                counts[year][borough].append(month_df.shape[0])
+                for label, count in zip(labels, borough_counts):
+                    print('       ', label, count)
     return counts
 
 
+def query_accidents_by_borough_and_month_and_year(cleaned_df, print_step=False):
+    """
+    Parses dataframe and returns a dictionary indicating accidents by borough
+    for each month in each year.
+    """
+    return query_accidents_by_borough_and_year(cleaned_df, 'MONTH', print_step=print_step)
+
+
 def query_accidents_by_borough_and_day_and_year(cleaned_df, print_step=False):
     """
     Parses dataframe and returns a dictionary indicating accidents by borough
     for each day of the week in each year.
     """
-    counts = defaultdict(lambda: defaultdict(list))
-    for year in YEARS:
-        if print_step:
-            print('Showing year:', year)
-        year_df = df_filter_by(cleaned_df, 'year', year)
-        for borough in BOROUGH_COORDS.keys():
-            if print_step:
-                print('   ', borough)
-            borough_df = df_filter_by(year_df, 'borough', borough)
-            for day in DAYS:
-                day_df = df_filter_by(borough_df, 'day', day)
-                if print_step:
-                    print('       ', day, day_df.shape[0])
-                counts[year][borough].append(day_df.shape[0])
-    return counts
+    return query_accidents_by_borough_and_year(cleaned_df, 'DAY', print_step=print_step)
 
 
 def query_accidents_by_borough_and_hour_and_year(cleaned_df, print_step=False):
@@ -296,22 +399,50 @@ def query_accidents_by_borough_and_hour_and_year(cleaned_df, print_step=False):
     Parses dataframe and returns a dictionary indicating accidents by borough
     for each hour of the day in each year.
     """
-    counts = defaultdict(lambda: defaultdict(list))
-    for year in YEARS:
-        if print_step:
-            print('Showing year:', year)
-        year_df = df_filter_by(cleaned_df, 'year', year)
-        for borough in BOROUGH_COORDS.keys():
-            if print_step:
-                print('   ', borough)
-            borough_df = df_filter_by(year_df, 'borough', borough)
-            for hour in HOURS:
-                # quantize times by top of the hour
-                hour_df = df_filter_by(borough_df, 'hour', hour)
-                if print_step:
-                    print('       ', hour, hour_df.shape[0])
-                counts[year][borough].append(hour_df.shape[0])
-    return counts
+    # quantize times by top of the hour
+    return query_accidents_by_borough_and_year(cleaned_df, 'HOUR', print_step=print_step)
+
+
+def show_figure(title=None):
+    """
+    Show the open figures, or save them to FIGURE_DIR in visualization worker processes.
+    Saved figures are named after title, or the title of their first axes when not given.
+    """
+    if not SAVE_FIGURES:
+        plt.show()
+        return
+    os.makedirs(FIGURE_DIR, exist_ok=True)
+    for number in plt.get_fignums():
+        figure = plt.figure(number)
+        name = title or next((ax.get_title() for ax in figure.axes if ax.get_title()), '')
+        # skip empty figures, they would only be blank images
+        if figure.axes and name:
+            slug = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+            figure.savefig(os.path.join(FIGURE_DIR, f'{slug}.png'))
+    plt.close('all')
+
+
+def init_worker(cleaned_path):
+    """
+    Set up a visualization worker process to plot without a display and load the cleaned data once.
+    """
+    global SAVE_FIGURES
+    plt.switch_backend('Agg')
+    SAVE_FIGURES = True
+    cleaned_df = pd.read_parquet(cleaned_path)
+    year_groups = dict(tuple(cleaned_df.groupby('YEAR', sort=False)))
+    WORKER_DATA['cleaned_df'] = cleaned_df
+    WORKER_DATA['year_df_dict'] = {year: year_groups.get(year, cleaned_df.iloc[:0]) for year in YEARS}
+
+
+def run_worker_visualization(visualization, pass_years=False, **kwargs):
+    """
+    Run a visualization in a worker process on the cleaned data loaded by init_worker.
+    Set pass_years for visualizations that also take the data split by year.
+    """
+    if pass_years:
+        return visualization(WORKER_DATA['cleaned_df'], WORKER_DATA['year_df_dict'], **kwargs)
+    return visualization(WORKER_DATA['cleaned_df'], **kwargs)
 
 
 def plot_multiple_bar_by_metric(data, metric, title='', xlabel='', ylabel='', colors=None, total_width=0.8, single_width=1, legend=True):
@@ -332,9 +463,8 @@ def plot_multiple_bar_by_metric(data, metric, title='', xlabel='', ylabel='', co
         # where to reposition bar from x
         x_offset = (i - n_bars / 2) * bar_width + bar_width / 2
 
-        # x and y position for each bar
-        for x, y in enumerate(values):
-            bar = ax.bar(x + x_offset, y, width=bar_width * single_width, color=colors[i % len(colors)])
+        # x and y position for every bar of the series at once
+        bar = ax.bar(np.arange(len(values)) + x_offset, values, width=bar_width * single_width, color=colors[i % len(colors)])
 
         bars.append(bar[0])
     # add title, labels, legend
@@ -344,7 +474,7 @@ def plot_multiple_bar_by_metric(data, metric, title='', xlabel='', ylabel='', co
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
-    plt.show()
+    show_figure()
 
 
 def plot_density_by_metric(df, metric, metric_name, hue, hue_order=[], title='', xlabel='', ylabel='', colors=None, legend=True):
@@ -365,7 +495,7 @@ def plot_density_by_metric(df, metric, metric_name, hue, hue_order=[], title='',
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
-    plt.show()
+    show_figure()
 
 
 def subplot_multiple_bar_by_metric(ax, data, metric, title='', xlabel='', ylabel='', y_max=0, y_scale=None, total_width=0.8, single_width=1, legend=True):
@@ -384,10 +514,9 @@ def subplot_multiple_bar_by_metric(ax, data, metric, title='', xlabel='', ylabel
         # where to reposition bar from x
         x_offset = (i - n_bars / 2) * bar_width + bar_width / 2
 
-        # x and y position for each bar
-        for x, y in enumerate(values):
-            y_max = max(y_max, y)
-            bar = ax.bar(x + x_offset, y, width=bar_width * single_width, color=colors[i % len(colors)])
+        # x and y position for every bar of the series at once
+        y_max = max(y_max, max(values))
+        bar = ax.bar(np.arange(len(values)) + x_offset, values, width=bar_width * single_width, color=colors[i % len(colors)])
 
         bars.append(bar[0])
     # add title, labels, legend
@@ -401,19 +530,36 @@ def subplot_multiple_bar_by_metric(ax, data, metric, title='', xlabel='', ylabel
     plt.ylabel(ylabel)
 
 
+@lru_cache(maxsize=1)
+def nyc_basemap():
+    """
+    Build the full resolution map of NYC once, its coastline data is slow to load.
+    """
+    return Basemap(llcrnrlon=MIN_LONGITUDE,
+                   llcrnrlat=MIN_LATITUDE,
+                   urcrnrlon=MAX_LONGITUDE,
+                   urcrnrlat=MAX_LATITUDE,
+                   ellps='WGS84',
+                   resolution='f',
+                   area_thresh=0.6)
+
+
+@lru_cache(maxsize=8)
+def borough_image(borough):
+    """
+    Load the background map image of a borough once and reuse it across plots.
+    """
+    with Image.open(f'{borough.lower()}.png') as im:
+        return im.copy()
+
+
 def plot_basemap_scatter(cleaned_df):
     """
     Scatterplot of latitude and longitude. Does not display density of points well.
     """
     latlon = cleaned_df.loc[cleaned_df['LONGITUDE'] != 0, ['LATITUDE', 'LONGITUDE']].to_numpy()
 
-    map = Basemap(llcrnrlon=MIN_LONGITUDE,
-                  llcrnrlat=MIN_LATITUDE,
-                  urcrnrlon=MAX_LONGITUDE,
-                  urcrnrlat=MAX_LATITUDE,
-                  ellps='WGS84',
-                  resolution='f',
-                  area_thresh=0.6)
+    map = nyc_basemap()
     map.drawcoastlines(color='gray', zorder=2)
     map.drawcountries(color='gray', zorder=2)
     map.fillcontinents(color='#FFEEDD')
@@ -421,18 +567,50 @@ def plot_basemap_scatter(cleaned_df):
     map.drawmapboundary(fill_color='#DDEEFF')
 
     map.scatter(latlon[:, 1], latlon[:, 0], marker='o', c='red', zorder=3, latlon=True)
-    plt.show()
+    show_figure()
+
+
+def density_estimation(lon, lat, grid_size=100):
+    """
+    Compute the kernel density of lat and long into a third dimension using a Gaussian.
+    Points are binned onto the grid and then smoothed, rather than evaluating every point at every grid position.
+    """
+    lon_values, lat_values = np.mgrid[lon.min():lon.max():grid_size * 1j, lat.min():lat.max():grid_size * 1j]
+    lon_step = lon_values[1, 0] - lon_values[0, 0]
+    lat_step = lat_values[0, 1] - lat_values[0, 0]
+    # count points in bins centered on the grid positions
+    lon_edges = np.linspace(lon.min() - lon_step / 2, lon.max() + lon_step / 2, grid_size + 1)
+    lat_edges = np.linspace(lat.min() - lat_step / 2, lat.max() + lat_step / 2, grid_size + 1)
+    counts, _, _ = np.histogram2d(lon, lat, bins=[lon_edges, lat_edges])
+    # Scott's rule bandwidth on the full lon/lat covariance, the same default as scipy's gaussian_kde, measured in grid steps
+    steps = np.array([lon_step, lat_step])
+    kernel_cov = np.cov([lon, lat]) * len(lon) ** (-1 / 3) / np.outer(steps, steps)
+    # evaluate the Gaussian kernel on grid step offsets up to 4 standard deviations out
+    radius = np.minimum(np.ceil(4 * np.sqrt(np.diag(kernel_cov))), grid_size).astype(int)
+    offsets = np.mgrid[-radius[0]:radius[0] + 1, -radius[1]:radius[1] + 1]
+    exponent = np.einsum('i...,ij,j...->...', offsets, np.linalg.inv(kernel_cov), offsets)
+    kernel = np.exp(-0.5 * exponent)
+    kernel /= kernel.sum()
+    # smooth the counts with the kernel and normalize into a density
+    density_values = fftconvolve(counts, kernel, mode='same') / (len(lon) * lon_step * lat_step)
+    # the fft leaves tiny negative rounding errors where there are no points
+    np.clip(density_values, 0, None, out=density_values)
+    return lon_values, lat_values, density_values
 
 
-def density_estimation(lon, lat):
+def cached_density_estimation(lon, lat):
     """
-    Compute the kernel density of lat and long into a third dimension using a Gaussian
+    Load the kernel density of lat and long from KDE_CACHE_DIR, computing and saving it when missing.
+    Cached grids are keyed by a hash of the coordinates.
     """
-    lon_values, lat_values = np.mgrid[lon.min():lon.max():100j, lat.min():lat.max():100j]
-    positions = np.vstack([lon_values.ravel(), lat_values.ravel()])
-    # compute the kernel from latitude and longitude values
-    kernel = gaussian_kde(np.vstack([lon, lat]))
-    density_values = np.reshape(kernel(positions).T, lon_values.shape)
+    digest = hashlib.sha1(np.ascontiguousarray(lon).tobytes() + np.ascontiguousarray(lat).tobytes()).hexdigest()
+    path = os.path.join(KDE_CACHE_DIR, f'binned_cov_kde_{digest}.npz')
+    if os.path.exists(path):
+        with np.load(path) as cached:
+            return cached['lon_values'], cached['lat_values'], cached['density_values']
+    lon_values, lat_values, density_values = density_estimation(lon, lat)
+    os.makedirs(KDE_CACHE_DIR, exist_ok=True)
+    np.savez_compressed(path, lon_values=lon_values, lat_values=lat_values, density_values=density_values)
     return lon_values, lat_values, density_values
 
 
@@ -442,24 +620,24 @@ def plot_basemap_heat_density(borough_df, borough, xprecision=3, yprecision=3, n
     filtered to only contain the borough and only valid coordinates in that borough.
     """
     _, ax = plt.subplots()
-    latlon = borough_df[['LATITUDE', 'LONGITUDE']].to_numpy()
+    extent = BOROUGH_EXTENT[borough]
+    llcrnrlon, urcrnrlon, llcrnrlat, urcrnrlat = extent
     # longitude
-    lon = latlon[:, 1]
+    lon = borough_df['LONGITUDE'].to_numpy()
     # latitude
-    lat = latlon[:, 0]
+    lat = borough_df['LATITUDE'].to_numpy()
+    # drop points outside of the map extent before estimating their density
+    within = (llcrnrlon <= lon) & (lon <= urcrnrlon) & (llcrnrlat <= lat) & (lat <= urcrnrlat)
+    lon = lon[within]
+    lat = lat[within]
 
     # perform kernel density estimation on longitude, latitude
-    lon_values, lat_values, density_values = density_estimation(lon, lat)
+    lon_values, lat_values, density_values = cached_density_estimation(lon, lat)
 
-    extent = BOROUGH_EXTENT[borough]
-    llcrnrlon, urcrnrlon, llcrnrlat, urcrnrlat = extent
-    # use image of borough map as background
-    map = Basemap(llcrnrlon=llcrnrlon,
-                  llcrnrlat=llcrnrlat,
-                  urcrnrlon=urcrnrlon,
-                  urcrnrlat=urcrnrlat)
-    im = Image.open(f'{borough.lower()}.png')
-    map.imshow(im, origin='upper', alpha=0.85, extent=extent)
+    # use image of borough map as background, plotted directly in longitude and latitude
+    im = borough_image(borough)
+    ax.imshow(im, origin='upper', alpha=0.85, extent=extent)
+    ax.set_aspect('equal')
 
     # add axis settings
     xlabels = np.around(np.linspace(llcrnrlon, urcrnrlon, xprecision), 2)
@@ -468,21 +646,20 @@ def plot_basemap_heat_density(borough_df, borough, xprecision=3, yprecision=3, n
     ax.set_ylim(llcrnrlat, urcrnrlat)
     ax.set_xticks(xlabels)
     ax.set_yticks(ylabels)
-    map.drawmeridians(xlabels, labels=[1,0,0,0], linewidth=0)
-    map.drawparallels(ylabels, labels=[0,0,0,1], linewidth=0)
 
     # generate density contours
     levels = np.linspace(0, density_values.max(), num_levels)
-    map.contourf(lon_values, lat_values, density_values, levels=levels, cmap=cmap,
-                 alpha=0.5, extent=np.around([lon.min(), lon.max(), lat.min(), lat.max()], 3))
+    contours = ax.contourf(lon_values, lat_values, density_values, levels=levels, cmap=cmap, alpha=0.5)
 
     # show contour bar
     if colorbar:
-        map.colorbar(pad=0.5)
+        cax = make_axes_locatable(ax).append_axes('right', size='5%', pad=0.5)
+        plt.colorbar(contours, cax=cax)
+        plt.sca(ax)
 
     plt.title(title)
 
-    plt.show()
+    show_figure()
 
 
 def visualize_one(cleaned_df):
@@ -528,25 +705,22 @@ def visualize_five(cleaned_df, year_df_dict, subplot=False):
             legend = index == 0
             ax = fig.add_subplot(2, 2, index + 1)
             subplot_multiple_bar_by_metric(ax, data[year], HOURS, title=f'Accidents by Hour each Day of the Week in {year}', xlabel='Hour', ylabel='Accidents', y_max=2800, y_scale=500, legend=legend)
-        plt.show()
+        show_figure(title='Accidents by Hour each Day of the Week from 2013 to 2016')
 
         fig = plt.figure()
         for index, year in enumerate(YEARS[4:]):
             legend = index == 0
             ax = fig.add_subplot(2, 2, index + 1)
             subplot_multiple_bar_by_metric(ax, data[year], HOURS, title=f'Accidents by Hour each Day of the Week in {year}', xlabel='Hour', ylabel='Accidents', y_max=2800, y_scale=500, legend=legend)
-        plt.show()
+        show_figure(title='Accidents by Hour each Day of the Week from 2017 to 2020')
     for year in YEARS:
         plot_multiple_bar_by_metric(data[year], HOURS, title=f'Accidents by Hour each Day of the Week in {year}', xlabel='Hour', ylabel='Accidents')
         year_df = year_df_dict[year]
-        # make a copy to overwrite columns for visualization
-        year_copy_df = year_df.copy()
-        year_copy_df['DAY'] = year_copy_df['CRASH TIME'].dt.day_name()
-        year_copy_df['CRASH TIME'] = year_copy_df['CRASH TIME'].dt.hour
+        # label the precomputed day numbers with day names, the names are only stored once as categories
         cat_type = CategoricalDtype(categories=DAYS, ordered=True)
-        year_copy_df['DAY'] = year_copy_df['DAY'].astype(cat_type)
+        year_day_df = year_df.assign(DAY=pd.Categorical.from_codes(year_df['DAY'], dtype=cat_type))
         metric = [0, 23]
-        plot_density_by_metric(year_copy_df, metric, 'CRASH TIME', 'DAY', title=f'Accident Density by Hour each Day of the Week in {year}', xlabel='Hour', ylabel='Accident Density')
+        plot_density_by_metric(year_day_df, metric, 'HOUR', 'DAY', title=f'Accident Density by Hour each Day of the Week in {year}', xlabel='Hour', ylabel='Accident Density')
 
 
 def visualize_six(cleaned_df, year_df_dict, month=True, weekday=True, hour=True, subplot=False):
@@ -567,14 +741,14 @@ def visualize_six(cleaned_df, year_df_dict, month=True, weekday=True, hour=True,
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], MONTHS.keys(), title=f'Accidents in Boroughs by Month in {year}', xlabel='Month', ylabel='Accidents', y_max=5000, y_scale=1000, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Month from 2013 to 2016')
 
             fig = plt.figure()
             for index, year in enumerate(YEARS[4:]):
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], MONTHS.keys(), title=f'Accidents in Boroughs by Month in {year}', xlabel='Month', ylabel='Accidents', y_max=5000, y_scale=1000, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Month from 2017 to 2020')
         for year in YEARS:
             plot_multiple_bar_by_metric(data[year], MONTHS.keys(), title=f'Accidents in Boroughs by Month in {year}', xlabel='Month', ylabel='Accidents')
             metric = [datetime(year, 1, 1), datetime(year, 12, 31)]
@@ -590,14 +764,14 @@ def visualize_six(cleaned_df, year_df_dict, month=True, weekday=True, hour=True,
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], DAYS, title=f'Accidents in Boroughs by Day of the Week in {year}', xlabel='Day of the Week', ylabel='Accidents', y_max=7900, y_scale=1000, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Day of the Week from 2013 to 2016')
 
             fig = plt.figure()
             for index, year in enumerate(YEARS[4:]):
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], DAYS, title=f'Accidents in Boroughs by Day of the Week in {year}', xlabel='Day of the Week', ylabel='Accidents', y_max=7900, y_scale=1000, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Day of the Week from 2017 to 2020')
         for year in YEARS:
             plot_multiple_bar_by_metric(data[year], DAYS, title=f'Accidents in Boroughs by Day of the Week in {year}', xlabel='Day of the Week', ylabel='Accidents')
 
@@ -610,64 +784,54 @@ def visualize_six(cleaned_df, year_df_dict, month=True, weekday=True, hour=True,
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], HOURS, title=f'Accidents in Boroughs by Hour in {year}', xlabel='Hour', ylabel='Accidents', y_max=4000, y_scale=500, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Hour from 2013 to 2016')
 
             fig = plt.figure()
             for index, year in enumerate(YEARS[4:]):
                 legend = index == 0
                 ax = fig.add_subplot(2, 2, index + 1)
                 subplot_multiple_bar_by_metric(ax, data[year], HOURS, title=f'Accidents in Boroughs by Hour in {year}', xlabel='Hour', ylabel='Accidents', y_max=4000, y_scale=500, legend=legend)
-            plt.show()
+            show_figure(title='Accidents in Boroughs by Hour from 2017 to 2020')
         for year in YEARS:
             plot_multiple_bar_by_metric(data[year], HOURS, title=f'Accidents in Boroughs by Hour in {year}', xlabel='Hour', ylabel='Accidents')
             year_df = year_df_dict[year]
-            # make a copy to overwrite columns for visualization
-            year_df = year_df.copy()
-            year_df['HOUR'] = year_df['CRASH TIME'].dt.hour
             metric = [0, 23]
             plot_density_by_metric(year_df, metric, 'HOUR', 'BOROUGH', hue_order=BOROUGH_COORDS.keys(), title=f'Accident Density in Boroughs by Hour in {year}', xlabel='Hour', ylabel='Accident Density')
         # density plot by hour for each year from 2013 to 2020
-        for borough in BOROUGH_COORDS.keys():
-            temp_df = df_filter_by(cleaned_df, 'borough', borough)
-            temp_df = temp_df.copy()
-            temp_df = df_between_years(temp_df, 2013, 2020)
-            temp_df['HOUR'] = temp_df['CRASH TIME'].dt.hour
-            temp_df['YEAR'] = temp_df['CRASH TIME'].dt.year
+        # build the masks from numpy arrays so each borough is copied out of the dataframe only once
+        within_years = cleaned_df['YEAR'].between(2013, 2020).to_numpy()
+        borough_codes = column_codes(cleaned_df, 'BOROUGH')
+        for borough_code, borough in enumerate(BOROUGH_COORDS.keys()):
+            temp_df = cleaned_df[within_years & (borough_codes == borough_code)]
             metric = [0, 23]
             plot_density_by_metric(temp_df, metric, 'HOUR', 'YEAR', hue_order=list(YEARS), title=f'Accident Density by Hour in {borough.title()} for Each Year', xlabel='Hour', ylabel='Accident Density')
 
 
-def visualize_seven(year_df_dict, boroughs=BOROUGH_COORDS.keys(), selected_year=None):
+def visualize_seven(cleaned_df, boroughs=BOROUGH_COORDS.keys(), selected_year=None):
     """
     Filter the dataframe to get the data for plotting a density heat map plot
     by borough for each year.
-    By default plot all years in the dict and for all boroughs.
+    By default plot all years and for all boroughs.
     Optionally specify a single year or list of boroughs.
     """
     # make sure the optional selected year is within acceptable range
     if selected_year is not None:
         assert selected_year > 2012 and selected_year < 2021
+        years = [selected_year]
+    else:
+        years = YEARS
+    # split by borough and year in one pass so each plot only filters its own rows
+    borough_year_groups = dict(tuple(cleaned_df.groupby(['BOROUGH', 'YEAR'], observed=True, sort=False)))
     for borough in boroughs:
-        if selected_year is None:
-            for year in year_df_dict.keys():
-                # filter by year and borough
-                year_df = year_df_dict[year]
-                borough_df = df_filter_by(year_df, 'borough', borough)
-                # make sure coordinates are in borough
-                c1, c2 = BOROUGH_BOUNDS[borough]
-                borough_df = df_between_coords(borough_df, c1, c2)
-                title = f'Accident Density in {borough.title()} in {year}'
-                plot_basemap_heat_density(borough_df, borough, title=title)
-        else:
-            # filter by year and borough
-            year_df = year_df_dict[selected_year]
-            borough_df = df_filter_by(year_df, 'borough', borough)
+        c1, c2 = BOROUGH_BOUNDS[borough]
+        for year in years:
+            borough_df = borough_year_groups.get((borough, year), cleaned_df.iloc[:0])
             # make sure coordinates are in borough
-            c1, c2 = BOROUGH_BOUNDS[borough]
             borough_df = df_between_coords(borough_df, c1, c2)
-            title = f'Accident Density in {borough.title()} in {selected_year}'
+            title = f'Accident Density in {borough.title()} in {year}'
             plot_basemap_heat_density(borough_df, borough, title=title)
 
+
 def query_accidents_by_deaths_and_month(cleaned_df, print_step=False):
     """
     retrieves the number of accident deaths by each month, also returns
@@ -696,92 +860,124 @@ def visualize_nine(cleaned_df):
     plot_multiple_bar_by_metric(data, years,
                                 title=f'Accidents Deaths by Month from 2013 to 2020', xlabel='Month',
                                 ylabel='Deaths')
-    plt.show()
+    show_figure()
     fig = plt.figure()
     plot_multiple_bar_by_metric(data_with_ratio, years,
                                 title=f'Death to Accident Ratio by Month from 2013 to 2020', xlabel='Month',
                                 ylabel='Death to Accident Ratio')
-    plt.show()
+    show_figure()
 
-def visualize_three():
+def query_accidents_by_type_and_year(factor_df):
     """
-    Create a visualization for each type of accident per year.
-    Accident type is classified by contributing factors and/or involved parties.
+    Count every contributing factor and involved party in each year in a single pass over the data.
+    Returns a dataframe indexed by year with one column per factor, pedestrian and vehicle only accidents.
     """
-    # read in cleaned data - visualization specific
-    cleaned_df = pd.read_csv(CLEAN_MOTOR_VEHICLE_COLLISIONS_CSV)
-    # creates a dictionary where each key maps to a list
-    counts_total = defaultdict(list)
-    counts_percentage= defaultdict(list)
-    for year in YEARS:
-        filtered_data = cleaned_df[cleaned_df['CRASH YEAR {}'.format(year)] == 1]
-        total_year_count = 0
-        for column in ['Drug Related Factor', 'Personal Factor', 'Environmental Cause Factor', 'Failure To Obey Traffic Factor']:
-            # remove rows from df that don't contain column_value in column_name column
-            column_value_df = filtered_data[filtered_data[column] == 1]
+    # the factor and pedestrian columns are 0 or 1, so summing them by year counts every one of them
+    year_groups = factor_df.groupby('YEAR')
+    type_counts = year_groups[FACTOR_COLUMNS + ['INVOLVED TYPE PEDESTRIAN']].sum().reindex(YEARS, fill_value=0)
+    # the rest of the accidents in each year involved vehicles only
+    type_counts['VEHICLE ONLY'] = year_groups.size().reindex(YEARS, fill_value=0) - type_counts['INVOLVED TYPE PEDESTRIAN']
+    return type_counts
 
-            counts_total[column].append(column_value_df.shape[0])
-            total_year_count += column_value_df.shape[0]
-        for column in counts_total:
-            counts_percentage[column].append(counts_total[column][-1] / total_year_count)
 
-    plot_multiple_bar_by_metric(counts_total, YEARS, title='Accident Causation Counts by Year', xlabel='Year', ylabel='Accidents')
+def involved_party_counts(type_counts):
+    """
+    Select the pedestrian and vehicle only accidents per year from the accident type counts.
+    """
+    return {column: type_counts[column].to_numpy() for column in ['INVOLVED TYPE PEDESTRIAN', 'VEHICLE ONLY']}
 
-    plot_multiple_bar_by_metric(counts_percentage, YEARS, title='Accident Causation Percentages by Year', xlabel='Year', ylabel='Accidents')
 
-    # creates a dictionary where each key maps to a list
-    counts = defaultdict(list)
-    for year in YEARS:
-        filtered_data = cleaned_df[cleaned_df['CRASH YEAR {}'.format(year)] == 1]
-        column ='INVOLVED TYPE PEDESTRIAN'
-        # remove rows from df that don't contain column_value in column_name column
-        column_value_df = filtered_data[filtered_data[column] == 1]
-        counts[column].append(column_value_df.shape[0])
-
-        # remove rows from df that don't contain column_value in column_name column
-        column_value_df = filtered_data[filtered_data[column] == 0]
-        counts['VEHICLE ONLY'].append(column_value_df.shape[0])
+def visualize_three(factor_df=None):
+    """
+    Create a visualization for each type of accident per year.
+    Accident type is classified by contributing factors and/or involved parties.
+    Expects the externally cleaned data from read_factor_data, which is read when not given.
+    Returns the involved party counts so visualize_eight can reuse them.
+    """
+    if factor_df is None:
+        factor_df = read_factor_data()
+    type_counts = query_accidents_by_type_and_year(factor_df)
+    factor_counts = type_counts[FACTOR_COLUMNS].to_numpy()
+    # one division gives the share of each factor within its year, years without any factor stay at 0
+    year_totals = factor_counts.sum(axis=1, keepdims=True)
+    factor_percentages = np.divide(factor_counts, year_totals, out=np.zeros(factor_counts.shape), where=year_totals > 0)
+
+    # creates a dictionary where each key maps to its counts by year
+    counts_total = {column: factor_counts[:, index] for index, column in enumerate(FACTOR_COLUMNS)}
+    counts_percentage = {column: factor_percentages[:, index] for index, column in enumerate(FACTOR_COLUMNS)}
+
+    # plot the counts and percentages side by side in one wide figure
+    fig = plt.figure(figsize=(12, 5))
+    ax = fig.add_subplot(1, 2, 1)
+    subplot_multiple_bar_by_metric(ax, counts_total, YEARS, title='Accident Causation Counts by Year', xlabel='Year', ylabel='Accidents')
+    ax = fig.add_subplot(1, 2, 2)
+    subplot_multiple_bar_by_metric(ax, counts_percentage, YEARS, title='Accident Causation Percentages by Year', xlabel='Year', ylabel='Accidents', legend=False)
+    show_figure(title='Accident Causation Counts and Percentages by Year')
+
+    counts = involved_party_counts(type_counts)
     plot_multiple_bar_by_metric(counts, YEARS, title='Involved Parties by Year', xlabel='Year', ylabel='Accidents')
+    return counts
 
 
-def visualize_eight():
+def visualize_eight(counts):
     """
     Create a visualization depicting involved parties in accidents by year.
     Involved party is either vehicle only or vehicle and pedestrian
+    Uses the involved party counts returned by visualize_three.
     """
-    # read in cleaned data - visualization specific
-    cleaned_df = pd.read_csv(CLEAN_MOTOR_VEHICLE_COLLISIONS_CSV)
-
-    # creates a dictionary where each key maps to a list
-    counts = defaultdict(list)
-    for year in YEARS:
-        filtered_data = cleaned_df[cleaned_df['CRASH YEAR {}'.format(year)] == 1]
-        column ='INVOLVED TYPE PEDESTRIAN'
-        # remove rows from df that don't contain column_value in column_name column
-        column_value_df = filtered_data[filtered_data[column] == 1]
-        counts[column].append(column_value_df.shape[0])
-
-        # remove rows from df that don't contain column_value in column_name column
-        column_value_df = filtered_data[filtered_data[column] == 0]
-        counts['VEHICLE ONLY'].append(column_value_df.shape[0])
     plot_multiple_bar_by_metric(counts, YEARS, title='Involved Parties by Year', xlabel='Year', ylabel='Accidents')
 
 
-def run_visualizations(cleaned_df, year_df_dict, subplot=False):
+def run_visualizations(cleaned_df, year_df_dict, subplot=False, workers=None):
     """
     Run all possible visualizations.
+    Set workers to render the independent visualizations in that many processes at once,
+    their figures are saved to FIGURE_DIR instead of being shown.
     """
+    if workers:
+        run_visualizations_in_parallel(cleaned_df, subplot=subplot, workers=workers)
+        return
     visualize_one(cleaned_df)
     visualize_two(cleaned_df)
-    visualize_three()
+    # the externally cleaned data is read and counted once for both visualizations
+    party_counts = visualize_three()
     visualize_four(cleaned_df)
     visualize_five(cleaned_df, year_df_dict, subplot=subplot)
     visualize_six(cleaned_df, year_df_dict, month=False, weekday=False, subplot=subplot)
-    visualize_seven(year_df_dict)
-    visualize_eight()
+    visualize_seven(cleaned_df)
+    visualize_eight(party_counts)
     visualize_nine(cleaned_df)
 
 
+def run_visualizations_in_parallel(cleaned_df, subplot=False, workers=None):
+    """
+    Run all possible visualizations in a pool of worker processes.
+    The cleaned data is handed to the workers through a temporary parquet file.
+    """
+    tasks = [
+        partial(run_worker_visualization, visualize_one),
+        partial(run_worker_visualization, visualize_two),
+        partial(run_worker_visualization, visualize_four),
+        partial(run_worker_visualization, visualize_five, pass_years=True, subplot=subplot),
+        partial(run_worker_visualization, visualize_six, pass_years=True, month=False, weekday=False, subplot=subplot),
+        partial(run_worker_visualization, visualize_seven),
+        partial(run_worker_visualization, visualize_nine),
+    ]
+    # each worker loads the data once instead of every task pickling its own copy
+    with tempfile.TemporaryDirectory() as handoff_dir:
+        cleaned_path = os.path.join(handoff_dir, 'cleaned_df.parquet')
+        cleaned_df.to_parquet(cleaned_path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(cleaned_path,)) as executor:
+            # the worker reads the factor data itself rather than receiving it
+            involved_party_future = executor.submit(visualize_three)
+            futures = [executor.submit(task) for task in tasks]
+            # visualize_eight plots the involved party counts from visualize_three
+            futures.append(executor.submit(visualize_eight, involved_party_future.result()))
+            # raise any error from the workers
+            for future in futures:
+                future.result()
+
+
 # ============================================================== #
 #  SECTION: Main                                                 #
 # ============================================================== #
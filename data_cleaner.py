@@ -20,8 +20,10 @@ import progressbar
 
 # CSV of motor vehicle collisions
 MOTOR_VEHICLE_COLLISIONS_CSV = 'Motor_Vehicle_Collisions_-_Crashes.csv'
-# cleaned CSV of motor vehicle collisions
-CLEAN_MOTOR_VEHICLE_COLLISIONS_CSV = 'Clean_Motor_Vehicle_Collisions_-_Crashes.csv'
+# cleaned parquet of motor vehicle collisions
+CLEAN_MOTOR_VEHICLE_COLLISIONS_PARQUET = 'Clean_Motor_Vehicle_Collisions_-_Crashes.parquet'
+# rows per parquet row group, small enough that filtered reads can skip whole groups
+PARQUET_ROW_GROUP_SIZE = 64 * 1024
 # sample data for testing
 SAMPLE_DATA_CSV = 'sample_data.csv'
 
@@ -315,14 +317,14 @@ if __name__ == '__main__':
     bar = progressbar.ProgressBar(maxval=len(collision_df),
                                   widgets=[progressbar.Bar('=', '[', ']'), ' ', progressbar.Percentage()])
     bar.start()
-    # initializing one hot coding resulting columns
-    unique_borough_columns = {borough: [0] * len(collision_df) for borough in unique_boroughs}
-    unique_factor_columns = {factor: [0] * len(collision_df) for factor in list(GENERALIZED_CAUSE_TO_SPECIFIC.keys())}
-    vehicle_type_columns = {vehicle_type: [0] * len(collision_df) for vehicle_type in list(GENERALIZED_TYPE_TO_SPECIFIC.keys())}
+    # initializing one hot coding resulting columns, int8 since they only hold 0 or 1
+    unique_borough_columns = {borough: np.zeros(len(collision_df), dtype=np.int8) for borough in unique_boroughs}
+    unique_factor_columns = {factor: np.zeros(len(collision_df), dtype=np.int8) for factor in list(GENERALIZED_CAUSE_TO_SPECIFIC.keys())}
+    vehicle_type_columns = {vehicle_type: np.zeros(len(collision_df), dtype=np.int8) for vehicle_type in list(GENERALIZED_TYPE_TO_SPECIFIC.keys())}
 
     year_columns = dict()
     month_columns = dict()
-    day_columns = {day: [0] * len(collision_df) for day in ['Sunday', 'Monday', 'Tuesday', 'Wednesday',
+    day_columns = {day: np.zeros(len(collision_df), dtype=np.int8) for day in ['Sunday', 'Monday', 'Tuesday', 'Wednesday',
                                                             'Thursday', 'Friday', 'Saturday']}
 
     for row_index, row in collision_df.iterrows():
@@ -333,10 +335,10 @@ if __name__ == '__main__':
         crash_date = row['CRASH DATE']
         month, day, year = row['CRASH DATE'].split('/')
         if year not in year_columns:
-            year_columns[year] = [0] * len(collision_df)
+            year_columns[year] = np.zeros(len(collision_df), dtype=np.int8)
         year_columns[year][row_index] = 1
         if month not in month_columns:
-            month_columns[month] = [0] * len(collision_df)
+            month_columns[month] = np.zeros(len(collision_df), dtype=np.int8)
         month_columns[month][row_index] = 1
         day_columns[datetime.strptime(crash_date, '%m/%d/%Y').strftime('%A')][row_index] = 1
 
@@ -406,5 +408,5 @@ if __name__ == '__main__':
     del collision_df['BOROUGH']
     print('Complete!')
 
-    # save cleaned data into csv
-    collision_df.to_csv(CLEAN_MOTOR_VEHICLE_COLLISIONS_CSV, index=False)
+    # save cleaned data into parquet, columnar so visualizations can load only the columns they use
+    collision_df.to_parquet(CLEAN_MOTOR_VEHICLE_COLLISIONS_PARQUET, index=False, row_group_size=PARQUET_ROW_GROUP_SIZE)